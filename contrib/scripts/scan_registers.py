@@ -0,0 +1,50 @@
+"""Utility script for mapping readable registers of a RENAC inverter."""
+
+import argparse
+import asyncio
+import logging
+import os
+
+from renac_ble import RenacInverterBLE
+from renac_ble.scanner import RegisterMap, RegisterScanner, read_firmware_key
+
+
+async def main() -> None:
+    """Scan a register range and save a resumable map per firmware version."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("address", help="BLE address of the inverter")
+    parser.add_argument("--start", type=int, default=10000)
+    parser.add_argument("--end", type=int, default=22000)
+    parser.add_argument("--span", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=3.0)
+    parser.add_argument("--out-dir", default="register_maps")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    inverter = RenacInverterBLE(args.address)
+    await inverter.connect()
+    print(f"🔌 Connected to {args.address}")
+    try:
+        key = await read_firmware_key(inverter)
+        os.makedirs(args.out_dir, exist_ok=True)
+        path = os.path.join(args.out_dir, f"{key}.json")
+        print(f"📄 Using map {path}")
+
+        scanner = RegisterScanner(
+            inverter,
+            RegisterMap.load(path, firmware=key),
+            path=path,
+            span=args.span,
+            timeout=args.timeout,
+        )
+        register_map = await scanner.scan(args.start, args.end)
+    finally:
+        await inverter.disconnect()
+
+    print(f"\n✅ Finished after {scanner.requests} requests. Readable ranges:")
+    for address, count in register_map.readable_ranges():
+        print(f" - {address}..{address + count - 1} ({count} registers)")
+
+
+asyncio.run(main())
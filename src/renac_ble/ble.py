@@ -2,18 +2,22 @@
 
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import Optional, Callable
 
 from bleak import BleakClient
 from bleak.backends.characteristic import BleakGATTCharacteristic
 
+from renac_ble.dispatch import NotificationDispatcher
 from renac_ble.modbus import (
     build_read_request,
+    extract_read_response,
     parse_response,
     parse_block_response,
     build_write_request,
     validate_write_response,
 )
+from renac_ble.records import Record
 from renac_ble.register import Register, RegisterBlock
 
 logger = logging.getLogger(__name__)
@@ -31,20 +35,37 @@ class RenacBLE:
         notification_callback: Optional[Callable[[bytes], None]] = None,
         write_uuid: str = WRITE_UUID,
         notify_uuid: str = NOTIFY_UUID,
+        adapter: Optional[str] = None,
+        notification_queue_size: int = 100,
+        notification_executor: Optional[Executor] = None,
     ) -> None:
         self.write_uuid = write_uuid
         self.notify_uuid = notify_uuid
         self.address = address
+        self.adapter = adapter
         self.client: Optional[BleakClient] = None
         self._response_event = asyncio.Event()
         self._last_data: Optional[bytes] = None
         self._notification_callback = notification_callback
         self._lock = asyncio.Lock()
+        # single-flight reads keyed by (address, count, write generation)
+        self._pending_reads: dict[tuple[int, int, int], asyncio.Future] = {}
+        self._write_generation = 0
+        # unsolicited frames are handed off so responses never wait on user code
+        self.dispatcher: Optional[NotificationDispatcher] = None
+        if notification_callback is not None:
+            self.dispatcher = NotificationDispatcher(
+                notification_callback,
+                maxsize=notification_queue_size,
+                executor=notification_executor,
+            )
 
     async def connect(self) -> None:
         """Connect to the device and start listening for notifications."""
 
-        self.client = BleakClient(self.address)
+        # ``adapter`` selects the local controller (e.g. ``hci1``) on BlueZ
+        kwargs = {"adapter": self.adapter} if self.adapter else {}
+        self.client = BleakClient(self.address, **kwargs)
         await self.client.connect()
         await self.client.start_notify(self.notify_uuid, self._notify_handler)
 
@@ -59,6 +80,8 @@ class RenacBLE:
         if self.client is not None and self.client.is_connected:
             await self.client.stop_notify(self.notify_uuid)
             await self.client.disconnect()
+        if self.dispatcher is not None:
+            await self.dispatcher.stop()
 
     async def _notify_handler(
         self, sender: BleakGATTCharacteristic, data: bytearray
@@ -70,8 +93,8 @@ class RenacBLE:
             self._last_data = bytes(data)
             self._response_event.set()
         # Otherwise treat it as unsolicited data
-        elif self._notification_callback:
-            self._notification_callback(bytes(data))
+        elif self.dispatcher is not None:
+            self.dispatcher.submit(bytes(data))
 
     async def _write_and_get_response(
         self, payload: bytes, timeout: float = 10.0
@@ -90,11 +113,73 @@ class RenacBLE:
                 return None
             return self._last_data
 
+    async def _read_registers(
+        self, address: int, count: int, timeout: float = 15.0
+    ) -> Optional[bytes]:
+        """Read ``count`` registers, sharing any pending read that covers them.
+
+        Concurrent reads of the same or an enclosing range share a single
+        radio transaction. Reads issued after a write never join a read that
+        was issued before it, so they observe the written value.
+        """
+
+        for (start, length, generation), future in list(self._pending_reads.items()):
+            if (
+                generation == self._write_generation
+                and start <= address
+                and address + count <= start + length
+            ):
+                try:
+                    resp = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    if not future.cancelled():
+                        raise
+                    # the shared read was cancelled, issue our own
+                    return await self._read_registers(address, count, timeout)
+                if not resp or (start, length) == (address, count):
+                    return resp
+                try:
+                    return extract_read_response(resp, address - start, count)
+                except ValueError:
+                    return None
+
+        key = (address, count, self._write_generation)
+        future = asyncio.get_running_loop().create_future()
+        # avoid "exception was never retrieved" when nobody joined
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending_reads[key] = future
+        try:
+            resp = await self._write_and_get_response(
+                build_read_request(address, count), timeout=timeout
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            del self._pending_reads[key]
+
+    async def read_raw_registers(
+        self, address: int, count: int, timeout: float = 15.0
+    ) -> Optional[bytes]:
+        """Read ``count`` registers and return the raw response frame.
+
+        The frame is returned as received (including Modbus exception
+        replies), or ``None`` on timeout. Concurrent reads are shared as in
+        :meth:`read_named_register`.
+        """
+
+        return await self._read_registers(address, count, timeout=timeout)
+
     async def read_named_register(self, register: Register) -> float | None:
         """Read and parse a single register defined by :class:`Register`."""
 
-        req = build_read_request(register["address"], register["count"])
-        resp = await self._write_and_get_response(req, timeout=15.0)
+        resp = await self._read_registers(register["address"], register["count"])
         if not resp:
             return None
         try:
@@ -114,6 +199,8 @@ class RenacBLE:
         req = build_write_request(
             register["address"], int(value / register["scale"])
         )
+        # later reads must not share a transaction issued before this write
+        self._write_generation += 1
         resp = await self._write_and_get_response(req, timeout=15.0)
         if not resp:
             return None
@@ -125,11 +212,10 @@ class RenacBLE:
             == value
         )
 
-    async def read_named_register_block(self, block: RegisterBlock) -> dict | None:
+    async def read_named_register_block(self, block: RegisterBlock) -> Record | None:
         """Read and parse a :class:`RegisterBlock` from the device."""
 
-        req = build_read_request(block["address"], block["count"])
-        resp = await self._write_and_get_response(req, timeout=15.0)
+        resp = await self._read_registers(block["address"], block["count"])
         if not resp:
             return None
         try:
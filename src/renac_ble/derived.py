@@ -0,0 +1,143 @@
+"""Derived telemetry fields computed from parsed register values."""
+
+import logging
+from typing import Callable, List, Mapping, Optional, Sequence, TypedDict
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class DerivedField(TypedDict):
+    name: str
+    inputs: List[str]  # register field or derived field names
+    func: Callable[..., Optional[float]]
+    unit: str
+
+
+def _ratio(part: float, whole: float) -> Optional[float]:
+    return part / whole if whole else None
+
+
+DERIVED_FIELDS: List[DerivedField] = [
+    {
+        "name": "eps_power",
+        "inputs": ["eps_r_power", "eps_s_power", "eps_t_power"],
+        "func": lambda r, s, t: r + s + t,
+        "unit": "W",
+    },
+    {
+        # consumption_* counts energy imported from the grid
+        "name": "grid_net_today_energy",
+        "inputs": ["consumption_today_energy", "feedin_today_energy"],
+        "func": lambda imported, exported: imported - exported,
+        "unit": "kWh",
+    },
+    {
+        "name": "battery_net_today_energy",
+        "inputs": ["battery_today_charge_energy", "battery_today_discharge_energy"],
+        "func": lambda charged, discharged: charged - discharged,
+        "unit": "kWh",
+    },
+    {
+        "name": "self_consumption_today_energy",
+        "inputs": ["pv_today_energy", "feedin_today_energy"],
+        "func": lambda pv, exported: max(pv - exported, 0),
+        "unit": "kWh",
+    },
+    {
+        "name": "self_consumption_today_ratio",
+        "inputs": ["self_consumption_today_energy", "pv_today_energy"],
+        "func": _ratio,
+        "unit": "",
+    },
+    {
+        "name": "self_sufficiency_today_ratio",
+        "inputs": ["self_consumption_today_energy", "load_today_energy"],
+        "func": lambda used, load: min(_ratio(used, load), 1.0) if load else None,
+        "unit": "",
+    },
+]
+
+
+def _sort_fields(fields: Sequence[DerivedField]) -> List[DerivedField]:
+    """Return ``fields`` so that every field follows the fields it depends on."""
+
+    by_name = {field["name"]: field for field in fields}
+    ordered: List[DerivedField] = []
+    state: dict[str, int] = {}  # 1: visiting, 2: done
+
+    def visit(field: DerivedField) -> None:
+        name = field["name"]
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            raise ValueError(f"Cyclic dependency in derived field {name}")
+        state[name] = 1
+        for dep in field["inputs"]:
+            if dep in by_name:
+                visit(by_name[dep])
+        state[name] = 2
+        ordered.append(field)
+
+    for field in fields:
+        visit(field)
+    return ordered
+
+
+class DerivedMetrics:
+    """Incrementally evaluate a dependency graph of :class:`DerivedField`.
+
+    Each call to :meth:`update` only recomputes fields whose inputs changed
+    since the previous sample. Keys absent from a sample keep their last
+    value, so partial samples (a single block) can be fed as they arrive.
+    A field evaluates to ``None`` when any input is ``None`` or unknown.
+    """
+
+    def __init__(self, fields: Sequence[DerivedField] = DERIVED_FIELDS) -> None:
+        self._fields = _sort_fields(fields)
+        self._values: dict[str, object] = {}
+        self.changed: set[str] = set()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Names of the derived fields, in evaluation order."""
+
+        return tuple(field["name"] for field in self._fields)
+
+    def _compute(self, field: DerivedField) -> Optional[float]:
+        args = [self._values.get(name) for name in field["inputs"]]
+        if any(arg is None for arg in args):
+            return None
+        try:
+            return field["func"](*args)
+        except (ArithmeticError, TypeError, ValueError) as e:
+            logger.warning("Failed to compute derived field %s: %s", field["name"], e)
+            return None
+
+    def update(self, sample: Mapping[str, object]) -> dict:
+        """Feed ``sample`` and return the current value of every derived field."""
+
+        dirty = set()
+        for name, value in sample.items():
+            if self._values.get(name, _MISSING) != value:
+                self._values[name] = value
+                dirty.add(name)
+
+        self.changed = set()
+        for field in self._fields:
+            name = field["name"]
+            if name in self._values and dirty.isdisjoint(field["inputs"]):
+                continue
+            value = self._compute(field)
+            if self._values.get(name, _MISSING) != value:
+                self._values[name] = value
+                dirty.add(name)
+                self.changed.add(name)
+        return {field["name"]: self._values[field["name"]] for field in self._fields}
+
+    def reset(self) -> None:
+        """Forget all known inputs and derived values."""
+
+        self._values.clear()
+        self.changed = set()
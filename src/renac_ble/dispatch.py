@@ -0,0 +1,120 @@
+"""Asynchronous dispatch of unsolicited notifications to user callbacks."""
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """Queue notifications and deliver them to ``callback`` from a consumer task.
+
+    :meth:`submit` never blocks, so the BLE notification path (and with it
+    the delivery of Modbus responses) does not wait on user code. When the
+    queue is full the oldest pending notification is dropped. If
+    ``executor`` is given the callback runs there, which suits blocking
+    callbacks such as synchronous MQTT publishes; otherwise it runs on the
+    event loop. In both cases an awaitable returned by the callback is
+    awaited on the event loop.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Any], Any],
+        maxsize: int = 100,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._callback = callback
+        self._executor = executor
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def submit(self, item: Any) -> None:
+        """Enqueue ``item`` for delivery, starting the consumer if needed."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._consume())
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+            logger.warning("Notification queue full, dropped oldest notification")
+        self._queue.put_nowait((time.monotonic(), item))
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    async def _deliver(self, item: Any) -> None:
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, self._callback, item)
+        else:
+            result = self._callback(item)
+        # coroutines returned from the executor are awaited on the loop
+        if inspect.isawaitable(result):
+            await result
+
+    async def _consume(self) -> None:
+        while True:
+            queued_at, item = await self._queue.get()
+            try:
+                await self._deliver(item)
+            except Exception:
+                self.errors += 1
+                logger.exception("Notification callback failed")
+            finally:
+                latency = time.monotonic() - queued_at
+                self.processed += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued notification has been delivered."""
+
+        await self._queue.join()
+
+    async def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Deliver pending notifications, then cancel the consumer task.
+
+        Notifications still queued after ``timeout`` seconds are discarded
+        and counted in ``dropped``.
+        """
+
+        if self._task is not None:
+            if not self._task.done():
+                try:
+                    await asyncio.wait_for(self.join(), timeout)
+                except asyncio.TimeoutError:
+                    logger.warning("Timed out delivering pending notifications")
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        """Return queue depth, drop counters and delivery latency metrics."""
+
+        return {
+            "depth": self._queue.qsize(),
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "avg_latency": self.total_latency / self.processed if self.processed else 0.0,
+            "max_latency": self.max_latency,
+        }
@@ -0,0 +1,386 @@
+"""Run many RENAC devices across several BLE adapters and processes.
+
+Devices are sharded over the local adapters (``hci0``, ``hci1``, ...) and
+each adapter gets its own worker process running plain :class:`RenacBLE`
+clients. Parsed samples are streamed back to the parent over a pipe using
+the compact binary encoding implemented by :class:`SampleEncoder`.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import struct
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Literal, Mapping, Optional, Sequence, TypedDict
+
+from renac_ble.ble import RenacBLE
+from renac_ble.inverter import RenacInverterBLE
+from renac_ble.wallbox import RenacWallboxBLE
+
+logger = logging.getLogger(__name__)
+
+# Message records
+_KEY_RECORD = 0x01
+_SAMPLE_RECORD = 0x02
+
+# Value tags
+_NONE = 0
+_INT = 1
+_FLOAT = 2
+_STR = 3
+_BOOL = 4
+_BYTES = 5
+
+_KEY = struct.Struct(">BHB")
+_SAMPLE = struct.Struct(">BHdH")
+_ITEM = struct.Struct(">HB")
+_INT_VALUE = struct.Struct(">q")
+_FLOAT_VALUE = struct.Struct(">d")
+_STR_LENGTH = struct.Struct(">H")
+_BOOL_VALUE = struct.Struct(">?")
+
+
+class FleetDevice(TypedDict):
+    address: str
+    kind: Literal["inverter", "wallbox"]
+
+
+SampleCallback = Callable[[str, float, dict], None]
+ClientFactory = Callable[
+    [FleetDevice, Optional[str], Callable[[Mapping[str, object]], None]], RenacBLE
+]
+
+
+def assign_adapters(
+    devices: Sequence[FleetDevice], adapters: Sequence[str]
+) -> dict[str, list[FleetDevice]]:
+    """Spread ``devices`` round-robin over ``adapters``."""
+
+    if not adapters:
+        raise ValueError("At least one adapter is required")
+    assignments: dict[str, list[FleetDevice]] = {adapter: [] for adapter in adapters}
+    for i, device in enumerate(devices):
+        assignments[adapters[i % len(adapters)]].append(device)
+    return assignments
+
+
+class SampleEncoder:
+    """Encode samples into compact binary messages.
+
+    Field names are sent once as key records and referenced by a 16-bit id
+    afterwards, so a steady stream of samples carries only ids and values.
+    An encoder must be paired with exactly one :class:`SampleDecoder`, and
+    every message it returns must be delivered, in order.
+
+    Supported values are ``None``, ``bool``, ``int``, ``float``, ``str`` and
+    ``bytes``; anything else raises :class:`TypeError`.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, int] = {}
+
+    @staticmethod
+    def _encode_value(value: object) -> tuple[int, bytes]:
+        if value is None:
+            return _NONE, b""
+        if isinstance(value, bool):
+            return _BOOL, _BOOL_VALUE.pack(value)
+        if isinstance(value, int):
+            return _INT, _INT_VALUE.pack(value)
+        if isinstance(value, float):
+            return _FLOAT, _FLOAT_VALUE.pack(value)
+        if isinstance(value, str):
+            raw = value.encode("utf-8")
+            return _STR, _STR_LENGTH.pack(len(raw)) + raw
+        if isinstance(value, (bytes, bytearray)):
+            return _BYTES, _STR_LENGTH.pack(len(value)) + bytes(value)
+        raise TypeError(f"Unsupported sample value type: {type(value).__name__}")
+
+    def encode(self, device: int, timestamp: float, sample: Mapping[str, object]) -> bytes:
+        """Return one message holding ``sample`` for device index ``device``."""
+
+        # encode values first so a rejected sample does not register keys
+        values = [(name, self._encode_value(value)) for name, value in sample.items()]
+        head = bytearray()
+        body = bytearray()
+        for name, (tag, raw) in values:
+            key = self._keys.get(name)
+            if key is None:
+                key = self._keys[name] = len(self._keys)
+                raw_name = name.encode("utf-8")
+                head += _KEY.pack(_KEY_RECORD, key, len(raw_name)) + raw_name
+            body += _ITEM.pack(key, tag) + raw
+        head += _SAMPLE.pack(_SAMPLE_RECORD, device, timestamp, len(values))
+        return bytes(head + body)
+
+
+class SampleDecoder:
+    """Decode messages produced by a :class:`SampleEncoder`."""
+
+    def __init__(self) -> None:
+        self._keys: dict[int, str] = {}
+
+    def decode(self, message: bytes) -> tuple[int, float, dict]:
+        """Return ``(device, timestamp, sample)`` for one message."""
+
+        view = memoryview(message)
+        pos = 0
+        while view[pos] == _KEY_RECORD:
+            _, key, length = _KEY.unpack_from(view, pos)
+            pos += _KEY.size
+            self._keys[key] = bytes(view[pos : pos + length]).decode("utf-8")
+            pos += length
+
+        record, device, timestamp, count = _SAMPLE.unpack_from(view, pos)
+        if record != _SAMPLE_RECORD:
+            raise ValueError(f"Unexpected record type: {record}")
+        pos += _SAMPLE.size
+
+        sample: dict[str, object] = {}
+        for _ in range(count):
+            key, tag = _ITEM.unpack_from(view, pos)
+            pos += _ITEM.size
+            if tag == _NONE:
+                value = None
+            elif tag == _INT:
+                (value,) = _INT_VALUE.unpack_from(view, pos)
+                pos += _INT_VALUE.size
+            elif tag == _FLOAT:
+                (value,) = _FLOAT_VALUE.unpack_from(view, pos)
+                pos += _FLOAT_VALUE.size
+            elif tag == _BOOL:
+                (value,) = _BOOL_VALUE.unpack_from(view, pos)
+                pos += _BOOL_VALUE.size
+            elif tag in (_STR, _BYTES):
+                (length,) = _STR_LENGTH.unpack_from(view, pos)
+                pos += _STR_LENGTH.size
+                value = bytes(view[pos : pos + length])
+                if tag == _STR:
+                    value = value.decode("utf-8")
+                pos += length
+            else:
+                raise ValueError(f"Unknown value tag: {tag}")
+            sample[self._keys[key]] = value
+        return device, timestamp, sample
+
+
+def default_client_factory(
+    device: FleetDevice,
+    adapter: Optional[str],
+    on_sample: Callable[[Mapping[str, object]], None],
+) -> RenacBLE:
+    """Create the BLE client matching ``device['kind']``."""
+
+    if device["kind"] == "inverter":
+        return RenacInverterBLE(device["address"], adapter=adapter)
+    if device["kind"] == "wallbox":
+        return RenacWallboxBLE(device["address"], on_notification=on_sample, adapter=adapter)
+    raise ValueError(f"Unsupported device kind: {device['kind']}")
+
+
+class FleetWorker:
+    """Poll the devices bound to one adapter and emit encoded samples.
+
+    Inverters are polled every ``poll_interval`` seconds, wallboxes push
+    their own notifications. Each encoded message is handed to ``send``,
+    which is a pipe in :class:`FleetRunner` but may be any callable.
+
+    ``send`` may block, so it is called from a thread by a writer task that
+    serves a queue of at most ``queue_size`` samples. When the queue is
+    full the oldest sample is dropped and counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        adapter: Optional[str],
+        devices: Sequence[FleetDevice],
+        send: Callable[[bytes], None],
+        poll_interval: float = 5.0,
+        retry_interval: float = 10.0,
+        client_factory: ClientFactory = default_client_factory,
+        queue_size: int = 1000,
+    ) -> None:
+        self.adapter = adapter
+        self.devices = list(devices)
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self._send = send
+        self._client_factory = client_factory
+        self._encoder = SampleEncoder()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._stop = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to disconnect all devices and return."""
+
+        self._stop.set()
+
+    def _emit(self, index: int, sample: Optional[Mapping[str, object]]) -> None:
+        if sample is None:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+            logger.warning("Sample queue full, dropped oldest sample")
+        # samples are encoded by the writer, so dropping one never loses keys
+        self._queue.put_nowait((index, time.time(), sample))
+
+    async def _write_samples(self) -> None:
+        while True:
+            index, timestamp, sample = await self._queue.get()
+            try:
+                message = self._encoder.encode(index, timestamp, sample)
+                await asyncio.to_thread(self._send, message)
+                self.sent += 1
+            except Exception:
+                self.dropped += 1
+                logger.exception("Failed to send sample")
+            finally:
+                self._queue.task_done()
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_device(self, index: int, device: FleetDevice) -> None:
+        client = self._client_factory(
+            device, self.adapter, lambda sample: self._emit(index, sample)
+        )
+        try:
+            while not self._stop.is_set():
+                try:
+                    if client.client is None or not client.is_connected():
+                        await client.connect()
+                        logger.info("Connected to %s via %s", device["address"], self.adapter)
+                    if device["kind"] == "inverter":
+                        self._emit(index, await client.get_power_and_energy_overview())
+                    await self._sleep(self.poll_interval)
+                except Exception:
+                    logger.exception("Error polling %s", device["address"])
+                    await self._sleep(self.retry_interval)
+        finally:
+            try:
+                await client.disconnect()
+            except Exception:
+                logger.debug("Error disconnecting %s", device["address"], exc_info=True)
+
+    async def run(self) -> None:
+        """Serve all devices until :meth:`stop` is called."""
+
+        writer = asyncio.get_running_loop().create_task(self._write_samples())
+        try:
+            await asyncio.gather(
+                *(self._run_device(i, device) for i, device in enumerate(self.devices))
+            )
+            await self._queue.join()
+        finally:
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+
+async def _serve(
+    adapter: str, devices: Sequence[FleetDevice], conn: Connection, poll_interval: float
+) -> None:
+    worker = FleetWorker(adapter, devices, conn.send_bytes, poll_interval)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover
+            pass
+    await worker.run()
+
+
+def _worker_main(
+    adapter: str, devices: Sequence[FleetDevice], conn: Connection, poll_interval: float
+) -> None:
+    """Entry point of a worker process."""
+
+    try:
+        asyncio.run(_serve(adapter, devices, conn, poll_interval))
+    finally:
+        conn.close()
+
+
+class FleetRunner:
+    """Shard devices over adapters with one worker process per adapter."""
+
+    def __init__(
+        self,
+        devices: Sequence[FleetDevice],
+        adapters: Sequence[str],
+        on_sample: SampleCallback,
+        poll_interval: float = 5.0,
+    ) -> None:
+        self.assignments = assign_adapters(devices, adapters)
+        self.poll_interval = poll_interval
+        self._on_sample = on_sample
+        self._processes: dict[str, multiprocessing.Process] = {}
+        self._connections: dict[Connection, str] = {}
+        self._decoders: dict[Connection, SampleDecoder] = {}
+
+    def start(self) -> None:
+        """Start one worker process for each adapter that has devices."""
+
+        for adapter, devices in self.assignments.items():
+            if not devices or adapter in self._processes:
+                continue
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_worker_main,
+                args=(adapter, devices, writer, self.poll_interval),
+                name=f"renac-fleet-{adapter}",
+                daemon=True,
+            )
+            process.start()
+            # keep only the worker's copy so a dead worker yields EOF
+            writer.close()
+            self._processes[adapter] = process
+            self._connections[reader] = adapter
+            self._decoders[reader] = SampleDecoder()
+
+    def stop(self) -> None:
+        """Terminate all worker processes."""
+
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes.values():
+            process.join(timeout=10.0)
+        self._processes.clear()
+
+    def _receive(self, conn: Connection) -> None:
+        try:
+            message = conn.recv_bytes()
+        except (EOFError, OSError):
+            logger.warning("Worker for %s exited", self._connections[conn])
+            del self._connections[conn]
+            del self._decoders[conn]
+            conn.close()
+            return
+        adapter = self._connections[conn]
+        index, timestamp, sample = self._decoders[conn].decode(message)
+        self._on_sample(self.assignments[adapter][index]["address"], timestamp, sample)
+
+    async def run(self) -> None:
+        """Start the workers and dispatch samples until they all exit."""
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        try:
+            while self._connections:
+                ready = await loop.run_in_executor(None, wait, list(self._connections), 0.5)
+                for conn in ready:
+                    self._receive(conn)
+        finally:
+            self.stop()
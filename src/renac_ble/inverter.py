@@ -2,11 +2,14 @@
 
 import logging
 from enum import IntEnum
+from typing import Iterable, Optional, Sequence
 
 from bleak.backends.characteristic import BleakGATTCharacteristic
 
 from renac_ble.ble import RenacBLE
+from renac_ble.derived import DERIVED_FIELDS, DerivedField, DerivedMetrics
 from renac_ble.modbus import validate_crc
+from renac_ble.records import Record, record_type
 from renac_ble.inverter_registers import *
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,22 @@ OVERVIEW_REGISTERS = {
 }
 
 
+def overview_record_type(derived_names: Iterable[str]) -> type[Record]:
+    """Return the overview record type for the given derived field names."""
+
+    return record_type(
+        "OverviewRecord",
+        [
+            *(field["name"] for field in TOTAL_ENERGY_BLOCK["fields"]),
+            *OVERVIEW_REGISTERS,
+            *derived_names,
+        ],
+    )
+
+
+OverviewRecord = overview_record_type(DerivedMetrics(DERIVED_FIELDS).names)
+
+
 class WorkMode(IntEnum):
     SELF_USE = 0
     FORCE_TIME_USE = 1
@@ -29,8 +48,14 @@ class WorkMode(IntEnum):
 class RenacInverterBLE(RenacBLE):
     """Client for interacting with RENAC hybrid inverters."""
 
-    def __init__(self, address: str) -> None:
-        super().__init__(address)
+    def __init__(
+        self,
+        address: str,
+        adapter: Optional[str] = None,
+        derived_fields: Sequence[DerivedField] = DERIVED_FIELDS,
+    ) -> None:
+        super().__init__(address, adapter=adapter)
+        self.derived = DerivedMetrics(derived_fields)
 
     async def _notify_handler(
         self, sender: BleakGATTCharacteristic, data: bytearray
@@ -42,24 +67,28 @@ class RenacInverterBLE(RenacBLE):
             return
         await super()._notify_handler(sender, data)
 
-    async def get_info(self) -> dict | None:
+    async def get_info(self) -> Record | None:
         """Return basic information about the inverter."""
 
         return await self.read_named_register_block(INVERTER_BASIC_INFO)
 
-    async def get_power_and_energy_overview(self) -> dict | None:
+    async def get_power_and_energy_overview(self) -> Record | None:
         """Collect an overview of current power and energy values."""
 
-        result = await self.read_named_register_block(TOTAL_ENERGY_BLOCK)
-        for name, register in OVERVIEW_REGISTERS.items():
-            result[name] = await self.read_named_register(register)
+        energy = await self.read_named_register_block(TOTAL_ENERGY_BLOCK)
+        if energy is None:
+            return None
+        overview = {
+            name: await self.read_named_register(register)
+            for name, register in OVERVIEW_REGISTERS.items()
+        }
         eps_data = await self.read_named_register_block(EPS_POWER_BLOCK)
-        result["eps_power"] = (
-            eps_data["eps_r_power"]
-            + eps_data["eps_s_power"]
-            + eps_data["eps_t_power"]
-        )
-        return result
+        if eps_data is None:
+            eps_data = {field["name"]: None for field in EPS_POWER_BLOCK["fields"]}
+        derived = self.derived.update({**energy, **overview, **eps_data})
+        # follow self.derived, which callers may replace with a custom graph
+        record = overview_record_type(self.derived.names)
+        return record(*energy.values(), *overview.values(), **derived)
 
     async def get_work_mode(self) -> WorkMode | None:
         value = await self.read_named_register(WORK_MODE)
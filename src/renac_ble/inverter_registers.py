@@ -5,6 +5,7 @@ from renac_ble.register import Register, RegisterBlock
 # https://www.photovoltaikforum.com/core/file-download/380139/
 
 INVERTER_BASIC_INFO: RegisterBlock = {
+    "name": "InverterBasicInfo",
     "address": 10000,
     "count": 38,
     "fields": [
@@ -17,6 +18,7 @@ INVERTER_BASIC_INFO: RegisterBlock = {
 }
 
 PV_INPUT_BLOCK: RegisterBlock = {
+    "name": "PvInput",
     "address": 11000,
     "count": 6,  # 6 registers total (each 2 bytes)
     "fields": [
@@ -72,6 +74,7 @@ PV_INPUT_BLOCK: RegisterBlock = {
 }
 
 TOTAL_ENERGY_BLOCK: RegisterBlock = {
+    "name": "TotalEnergy",
     "address": 14000,
     "count": 27,
     "fields": [
@@ -100,6 +103,7 @@ TOTAL_ENERGY_BLOCK: RegisterBlock = {
 }
 
 EPS_POWER_BLOCK: RegisterBlock = {
+    "name": "EpsPower",
     "address": 11094,
     "count": 3,  # 1 register per phase
     "fields": [
@@ -131,6 +135,7 @@ EPS_POWER_BLOCK: RegisterBlock = {
 }
 
 METER1_POWER_BLOCK: RegisterBlock = {
+    "name": "Meter1Power",
     "address": 11098,
     "count": 4,  # 4 consecutive registers: 11098 to 11101
     "fields": [
@@ -142,6 +147,7 @@ METER1_POWER_BLOCK: RegisterBlock = {
 }
 
 GRID_VOLTAGE_BLOCK: RegisterBlock = {
+    "name": "GridVoltage",
     "address": 11076,
     "count": 3,
     "fields": [
@@ -3,6 +3,7 @@
 import logging
 from typing import Literal, Union
 
+from renac_ble.records import Record, record_type
 from renac_ble.register import RegisterBlock
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,28 @@ def build_write_request(address: int, value: int) -> bytes:
     return crc16(request)
 
 
+def extract_read_response(frame: bytes, offset: int, count: int) -> bytes:
+    """Return a read response frame for ``count`` registers of ``frame``.
+
+    ``offset`` is the register offset within the range answered by ``frame``.
+    The returned frame is re-framed with a fresh byte count and CRC so it is
+    indistinguishable from a direct response to the narrower request.
+    Exception replies and malformed frames raise :class:`ValueError`.
+    """
+
+    if len(frame) < 5 or frame[1] != READ_REGISTER_CODE:
+        raise ValueError("Not a read response")
+    byte_count = frame[2]
+    if len(frame) != byte_count + 5:
+        raise ValueError("Byte count does not match response length")
+    # never slice past the data into the CRC
+    payload = frame[3 : 3 + byte_count]
+    data = payload[offset * 2 : (offset + count) * 2]
+    if offset < 0 or len(data) < count * 2:
+        raise ValueError("Not enough data in response")
+    return crc16(bytes([frame[0], frame[1], count * 2]) + data)
+
+
 Fmt = Literal["ascii", "uint16", "int16", "uint32", "int32", "custom"]
 
 
@@ -97,14 +120,27 @@ def parse_response(data: bytes, fmt: Fmt, count: int, scale: float) -> float:
     return parse_value(data[:expected_len], fmt, scale)
 
 
-def parse_block_response(data: bytes, block: RegisterBlock) -> dict:
+def block_record_type(block: RegisterBlock) -> type[Record]:
+    """Return the :class:`Record` type holding the fields of ``block``."""
+
+    return record_type(
+        block.get("name", "BlockRecord"), [field["name"] for field in block["fields"]]
+    )
+
+
+def parse_block_response(data: bytes, block: RegisterBlock) -> Record:
     """Parse a block of registers according to ``block`` definition."""
 
-    result = {}
-    for field in block["fields"]:
-        raw = data[field["offset"] : field["offset"] + field["length"]]
-        result[field["name"]] = parse_value(raw, field["fmt"], field["scale"])
-    return result
+    return block_record_type(block)(
+        *(
+            parse_value(
+                data[field["offset"] : field["offset"] + field["length"]],
+                field["fmt"],
+                field["scale"],
+            )
+            for field in block["fields"]
+        )
+    )
 
 
 def validate_write_response(data: bytes, expected_address: int, expected_value: int) -> bool:
@@ -0,0 +1,139 @@
+"""Compact ``__slots__`` result types for parsed telemetry."""
+
+from operator import attrgetter
+from typing import Any, Iterator, Sequence
+
+_RECORD_TYPES: dict[tuple, type["Record"]] = {}
+
+
+class Record:
+    """Base class for generated slot-based records.
+
+    Subclasses are created with :func:`record_type`. Records keep the
+    read-only mapping interface of the dicts they replace (``record[name]``,
+    ``get``, ``keys``, ``items``, ``in`` and ``**record``); :meth:`as_dict`
+    returns a plain ``dict`` where one is really needed, e.g. for JSON.
+    Fields that were not supplied default to ``None``. Optional fields are
+    left out of the mapping interface while they are ``None``, like a key
+    that a dict never had; they are always available as attributes.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _optional: frozenset[str] = frozenset()
+    _getter: Any = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        if len(args) > len(self._fields):
+            raise TypeError(
+                f"{type(self).__name__} takes at most {len(self._fields)} values"
+            )
+        for name, value in zip(self._fields, args):
+            setattr(self, name, value)
+        for name in self._fields[len(args) :]:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError(f"Unknown fields for {type(self).__name__}: {', '.join(kwargs)}")
+
+    def _all_values(self) -> tuple:
+        if len(self._fields) == 1:
+            return (self._getter(self),)
+        return self._getter(self) if self._fields else ()
+
+    def _has(self, key: object) -> bool:
+        if key in self._optional:
+            return getattr(self, key) is not None  # type: ignore[arg-type]
+        return key in self._fields
+
+    def keys(self) -> tuple[str, ...]:
+        if not self._optional:
+            return self._fields
+        return tuple(name for name in self._fields if self._has(name))
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        if not self._optional:
+            return zip(self._fields, self._all_values())
+        return ((name, getattr(self, name)) for name in self.keys())
+
+    def values(self) -> tuple:
+        """Return the values of :meth:`keys` in field order."""
+
+        if not self._optional:
+            return self._all_values()
+        return tuple(getattr(self, name) for name in self.keys())
+
+    def as_dict(self) -> dict:
+        """Return the record as a plain ``dict``."""
+
+        return dict(self.items())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if self._has(key):
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._has(key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return self._has(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return self._fields == other._fields and self._all_values() == other._all_values()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+def record_type(
+    name: str, fields: Sequence[str], optional: Sequence[str] = ()
+) -> type[Record]:
+    """Return a :class:`Record` subclass with one slot per name in ``fields``.
+
+    ``optional`` names fields that are hidden from the mapping interface
+    while ``None``.
+
+    Types are cached by name and fields, so repeated calls for the same
+    layout return the same class.
+    """
+
+    fields = tuple(fields)
+    optional = frozenset(optional)
+    key = (name, fields, optional)
+    cls = _RECORD_TYPES.get(key)
+    if cls is None:
+        reserved = [field for field in fields if hasattr(Record, field)]
+        if reserved:
+            raise ValueError(f"Reserved record field names: {', '.join(reserved)}")
+        cls = type(
+            name,
+            (Record,),
+            {
+                "__slots__": fields,
+                "_fields": fields,
+                "_optional": optional,
+                "_getter": attrgetter(*fields) if fields else None,
+            },
+        )
+        _RECORD_TYPES[key] = cls
+    return cls
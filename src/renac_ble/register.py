@@ -20,8 +20,12 @@ class RegisterField(TypedDict):
     unit: str
 
 
-class RegisterBlock(TypedDict):
+class _RegisterBlockBase(TypedDict):
     address: int
     count: int
     fields: List[RegisterField]
 
+
+class RegisterBlock(_RegisterBlockBase, total=False):
+    name: str  # class name of the parsed record
+
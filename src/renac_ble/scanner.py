@@ -0,0 +1,331 @@
+"""Map readable register ranges of a device by adaptive probing."""
+
+import bisect
+import json
+import logging
+import os
+from typing import Iterable, Literal, Mapping, Optional
+
+from renac_ble.ble import RenacBLE
+from renac_ble.inverter_registers import INVERTER_BASIC_INFO
+from renac_ble.modbus import READ_REGISTER_CODE
+from renac_ble.register import RegisterBlock
+
+logger = logging.getLogger(__name__)
+
+Status = Literal["readable", "unreadable"]
+
+# Modbus limits a single read to 125 registers
+MAX_READ_COUNT = 125
+
+
+def firmware_key(frame: Optional[bytes], block: RegisterBlock = INVERTER_BASIC_INFO) -> str:
+    """Return a file-name friendly key identifying a model and firmware.
+
+    ``frame`` is the raw response to a read of ``block``. Version registers
+    are used unscaled, because the scaled values from ``get_info`` truncate
+    different firmware versions to the same number. Only version fields
+    inside the returned payload are used.
+    """
+
+    if not frame or len(frame) < 5 or frame[1] != READ_REGISTER_CODE:
+        return "unknown"
+    data = frame[3 : 3 + min(frame[2], block["count"] * 2)]
+    parts = []
+    for field in block["fields"]:
+        end = field["offset"] + field["length"]
+        if end > len(data):
+            continue
+        raw = data[field["offset"] : end]
+        if field["name"] == "model":
+            parts.append(raw.decode("ascii", errors="ignore").strip("\x00 "))
+        elif field["name"].endswith("_version"):
+            parts.append(str(int.from_bytes(raw, byteorder="big")))
+    return "-".join(
+        part.replace(" ", "_").replace("/", "_") or "x" for part in parts
+    ) or "unknown"
+
+
+async def read_firmware_key(device: RenacBLE) -> str:
+    """Read the basic info block of ``device`` and return its firmware key."""
+
+    resp = await device.read_raw_registers(
+        INVERTER_BASIC_INFO["address"], INVERTER_BASIC_INFO["count"]
+    )
+    return firmware_key(resp)
+
+
+class RegisterMap:
+    """Sorted, non-overlapping ``[start, end)`` ranges with a read status."""
+
+    def __init__(self, firmware: str = "unknown") -> None:
+        self.firmware = firmware
+        self.ranges: list[tuple[int, int, Status]] = []
+
+    def _starts(self) -> list[int]:
+        return [start for start, _, _ in self.ranges]
+
+    def mark(self, address: int, count: int, status: Status) -> None:
+        """Record the status of ``count`` registers from ``address``."""
+
+        end = address + count
+        kept: list[tuple[int, int, Status]] = []
+        for start, stop, old in self.ranges:
+            if stop <= address or start >= end:
+                kept.append((start, stop, old))
+                continue
+            if start < address:
+                kept.append((start, address, old))
+            if stop > end:
+                kept.append((end, stop, old))
+        kept.append((address, end, status))
+        kept.sort()
+
+        merged: list[tuple[int, int, Status]] = []
+        for start, stop, value in kept:
+            if merged and merged[-1][1] == start and merged[-1][2] == value:
+                merged[-1] = (merged[-1][0], stop, value)
+            else:
+                merged.append((start, stop, value))
+        self.ranges = merged
+
+    def status(self, address: int) -> Optional[Status]:
+        """Return the status of ``address`` or ``None`` if it was not probed."""
+
+        i = bisect.bisect_right(self._starts(), address) - 1
+        if i >= 0 and address < self.ranges[i][1]:
+            return self.ranges[i][2]
+        return None
+
+    def is_known(self, address: int, count: int) -> bool:
+        """Return ``True`` if every register in the range has a status."""
+
+        position = address
+        end = address + count
+        for start, stop, _ in self.ranges:
+            if stop <= position:
+                continue
+            if start > position:
+                return False
+            position = stop
+            if position >= end:
+                return True
+        return position >= end
+
+    def known_end(self, address: int) -> Optional[int]:
+        """Return the end of the probed range holding ``address``, if any."""
+
+        i = bisect.bisect_right(self._starts(), address) - 1
+        if i >= 0 and address < self.ranges[i][1]:
+            return self.ranges[i][1]
+        return None
+
+    def next_known(self, address: int) -> Optional[int]:
+        """Return the start of the first probed range after ``address``."""
+
+        starts = self._starts()
+        i = bisect.bisect_right(starts, address)
+        return starts[i] if i < len(starts) else None
+
+    def readable_ranges(self) -> list[tuple[int, int]]:
+        """Return ``(address, count)`` for every readable range."""
+
+        return [
+            (start, stop - start)
+            for start, stop, status in self.ranges
+            if status == "readable"
+        ]
+
+    def plan_reads(
+        self, requests: Iterable[tuple[int, int]], max_count: int = MAX_READ_COUNT
+    ) -> list[tuple[int, int]]:
+        """Combine ``(address, count)`` requests into as few reads as possible.
+
+        Requests are merged only when the combined span stays inside a single
+        readable range and within ``max_count`` registers. Requests outside
+        known readable ranges are passed through unchanged.
+        """
+
+        plan: list[tuple[int, int]] = []
+        current: Optional[tuple[int, int, int]] = None  # start, end, range end
+        for address, count in sorted(requests):
+            end = address + count
+            i = bisect.bisect_right(self._starts(), address) - 1
+            limit = None
+            if i >= 0:
+                start, stop, status = self.ranges[i]
+                if status == "readable" and end <= stop:
+                    limit = stop
+            if (
+                current is not None
+                and limit == current[2]
+                and limit is not None
+                and max(end, current[1]) - current[0] <= max_count
+            ):
+                current = (current[0], max(end, current[1]), limit)
+                continue
+            if current is not None:
+                plan.append((current[0], current[1] - current[0]))
+            if limit is None:
+                plan.append((address, count))
+                current = None
+            else:
+                current = (address, end, limit)
+        if current is not None:
+            plan.append((current[0], current[1] - current[0]))
+        return plan
+
+    def to_dict(self) -> dict:
+        return {
+            "firmware": self.firmware,
+            "ranges": [[start, stop - start, status] for start, stop, status in self.ranges],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "RegisterMap":
+        register_map = cls(data.get("firmware", "unknown"))
+        for address, count, status in data.get("ranges", []):
+            register_map.mark(address, count, status)
+        return register_map
+
+    def save(self, path: str) -> None:
+        """Write the map to ``path`` atomically."""
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, firmware: str = "unknown") -> "RegisterMap":
+        """Load a map from ``path`` or return an empty one if it does not exist."""
+
+        if not os.path.exists(path):
+            return cls(firmware)
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+class RegisterScanner:
+    """Probe a device for readable register ranges.
+
+    Reads start at ``span`` registers and double after every readable span
+    up to ``max_span``. When a span fails, its readable prefix is found by
+    binary search. Inside an unreadable hole, single registers are probed
+    with a stride that doubles up to ``hole_stride``, and the end of the
+    hole is then bisected. Registers in a hole are not probed one by one, so
+    a readable island narrower than ``hole_stride`` may be missed.
+    Ranges already present in ``register_map`` are skipped, which makes
+    scans resumable when the map is saved to ``path``.
+    """
+
+    def __init__(
+        self,
+        device: RenacBLE,
+        register_map: Optional[RegisterMap] = None,
+        path: Optional[str] = None,
+        span: int = 32,
+        max_span: int = MAX_READ_COUNT,
+        hole_stride: int = 32,
+        timeout: float = 3.0,
+        save_every: int = 20,
+    ) -> None:
+        self.device = device
+        self.register_map = register_map or RegisterMap()
+        self.path = path
+        self.span = span
+        self.max_span = max_span
+        self.hole_stride = hole_stride
+        self.timeout = timeout
+        self.save_every = save_every
+        self.requests = 0
+
+    async def _is_readable(self, address: int, count: int) -> bool:
+        self.requests += 1
+        if self.path and self.requests % self.save_every == 0:
+            self.register_map.save(self.path)
+        try:
+            resp = await self.device.read_raw_registers(
+                address, count, timeout=self.timeout
+            )
+        except Exception as e:
+            logger.debug("Read of %s+%s failed: %s", address, count, e)
+            return False
+        return (
+            resp is not None
+            and len(resp) == count * 2 + 5
+            and resp[1] == READ_REGISTER_CODE
+            and resp[2] == count * 2
+        )
+
+    async def _readable_prefix(self, address: int, count: int) -> int:
+        """Return how many registers from ``address`` are readable.
+
+        ``count`` registers are known to fail as a whole.
+        """
+
+        good, bad = 0, count
+        while bad - good > 1:
+            mid = (good + bad) // 2
+            if await self._is_readable(address, mid):
+                good = mid
+            else:
+                bad = mid
+        return good
+
+    async def _hole_end(self, address: int, end: int) -> int:
+        """Return the first readable register after the unreadable ``address``."""
+
+        last_bad = address
+        step = 1
+        while True:
+            probe = last_bad + step
+            if probe >= end:
+                return end
+            if await self._is_readable(probe, 1):
+                break
+            last_bad = probe
+            step = min(step * 2, self.hole_stride)
+        good = probe
+        while good - last_bad > 1:
+            mid = (last_bad + good) // 2
+            if await self._is_readable(mid, 1):
+                good = mid
+            else:
+                last_bad = mid
+        return good
+
+    async def scan(self, start: int, end: int) -> RegisterMap:
+        """Scan registers in ``[start, end)`` and return the updated map."""
+
+        register_map = self.register_map
+        span = self.span
+        address = start
+        try:
+            while address < end:
+                known = register_map.known_end(address)
+                if known is not None:
+                    address = known
+                    continue
+                limit = min(end, register_map.next_known(address) or end)
+                count = min(span, limit - address)
+                if await self._is_readable(address, count):
+                    register_map.mark(address, count, "readable")
+                    address += count
+                    span = min(span * 2, self.max_span)
+                    continue
+
+                prefix = await self._readable_prefix(address, count)
+                if prefix:
+                    register_map.mark(address, prefix, "readable")
+                    address += prefix
+                # ``address`` is now the first unreadable register
+                hole_end = await self._hole_end(address, limit)
+                register_map.mark(address, hole_end - address, "unreadable")
+                address = hole_end
+                span = self.span
+                logger.info("Scanned up to register %s", address)
+        finally:
+            if self.path:
+                register_map.save(self.path)
+        return register_map
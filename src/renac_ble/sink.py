@@ -0,0 +1,251 @@
+"""Batched writing of telemetry samples to files, sockets or custom writers."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Callable, Mapping, Optional, Protocol, Union
+
+logger = logging.getLogger(__name__)
+
+Tags = Mapping[str, str]
+Encoder = Callable[[str, Tags, Mapping[str, object], int], Optional[str]]
+
+
+def _escape(value: str, chars: str) -> str:
+    value = value.replace("\\", "\\\\")
+    for char in chars:
+        value = value.replace(char, "\\" + char)
+    return value
+
+
+def _format_field(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def encode_line_protocol(
+    measurement: str, tags: Tags, fields: Mapping[str, object], timestamp: int
+) -> Optional[str]:
+    """Encode one sample as an InfluxDB line protocol line.
+
+    ``None`` fields are skipped; ``None`` is returned if no field remains.
+    ``timestamp`` is in nanoseconds.
+    """
+
+    encoded = ",".join(
+        f"{_escape(name, ',= ')}={_format_field(value)}"
+        for name, value in fields.items()
+        if value is not None
+    )
+    if not encoded:
+        return None
+    key = _escape(measurement, ", ")
+    if tags:
+        key += "," + ",".join(
+            f"{_escape(name, ',= ')}={_escape(str(value), ',= ')}"
+            for name, value in sorted(tags.items())
+        )
+    return f"{key} {encoded} {timestamp}\n"
+
+
+def encode_ndjson(
+    measurement: str, tags: Tags, fields: Mapping[str, object], timestamp: int
+) -> Optional[str]:
+    """Encode one sample as a single JSON line."""
+
+    return (
+        json.dumps(
+            {
+                "measurement": measurement,
+                "tags": dict(tags),
+                "fields": dict(fields.items()),
+                "time": timestamp,
+            },
+            separators=(",", ":"),
+        )
+        + "\n"
+    )
+
+
+ENCODERS: dict[str, Encoder] = {
+    "line": encode_line_protocol,
+    "ndjson": encode_ndjson,
+}
+
+
+class AsyncWriter(Protocol):
+    async def write(self, data: bytes) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class FileWriter:
+    """Append batches to a file without blocking the event loop."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "ab")
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._file.flush()
+
+    async def write(self, data: bytes) -> None:
+        await asyncio.to_thread(self._write, data)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._file.close)
+
+
+class UnixSocketWriter:
+    """Stream batches to a local UNIX socket, reconnecting when needed."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def write(self, data: bytes) -> None:
+        if self._writer is None or self._writer.is_closing():
+            _, self._writer = await asyncio.open_unix_connection(self.path)
+        try:
+            self._writer.write(data)
+            await self._writer.drain()
+        except (ConnectionError, OSError):
+            self._writer.close()
+            self._writer = None
+            raise
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+            self._writer = None
+
+
+class TelemetrySink:
+    """Encode samples and write them in batches.
+
+    A batch is flushed when it reaches ``max_batch`` lines or every
+    ``flush_interval`` seconds, whichever comes first. :meth:`submit` waits
+    for the flush of a full batch, so a slow writer slows producers down
+    instead of letting the buffer grow without bound.
+    """
+
+    def __init__(
+        self,
+        writer: AsyncWriter,
+        encoder: Union[str, Encoder] = "line",
+        measurement: str = "renac",
+        max_batch: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.writer = writer
+        self.encoder = ENCODERS[encoder] if isinstance(encoder, str) else encoder
+        self.measurement = measurement
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self._buffer: list[str] = []
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the periodic flush task."""
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Flush pending samples, stop the flush task and close the writer."""
+
+        if self._task is not None:
+            # let an in-flight periodic flush finish before cancelling it
+            async with self._flush_lock:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+        try:
+            await self.flush()
+        finally:
+            await self.writer.close()
+
+    async def __aenter__(self) -> "TelemetrySink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def submit(
+        self,
+        sample: Optional[Mapping[str, object]],
+        tags: Optional[Tags] = None,
+        timestamp: Optional[int] = None,
+        measurement: Optional[str] = None,
+    ) -> None:
+        """Queue ``sample``; ``timestamp`` defaults to now, in nanoseconds."""
+
+        if sample is None:
+            return
+        line = self.encoder(
+            measurement or self.measurement,
+            tags or {},
+            sample,
+            time.time_ns() if timestamp is None else timestamp,
+        )
+        if line is None:
+            return
+        self._buffer.append(line)
+        if len(self._buffer) >= self.max_batch:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered lines in one call to the writer."""
+
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            # a started write cannot be taken back (threads, queued socket
+            # bytes), so it always runs to completion, even when cancelled
+            write = asyncio.ensure_future(
+                self.writer.write("".join(lines).encode("utf-8"))
+            )
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                if not write.done():
+                    await asyncio.wait([write])
+                self._count(write, len(lines))
+                raise
+            except Exception:
+                self.dropped += len(lines)
+                raise
+            self.written += len(lines)
+
+    def _count(self, write: asyncio.Future, count: int) -> None:
+        if write.cancelled() or write.exception() is not None:
+            self.dropped += count
+        else:
+            self.written += count
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush telemetry batch")
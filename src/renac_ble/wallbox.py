@@ -2,30 +2,74 @@
 
 import logging
 import struct
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from renac_ble.ble import RenacBLE
+from renac_ble.records import Record, record_type
 
 logger = logging.getLogger(__name__)
 
+WALLBOX_FIELDS = (
+    "model",
+    "sn",
+    "manufacturer",
+    "version",
+    "state",
+    "phase_a_voltage",
+    "phase_a_current",
+    "phase_b_voltage",
+    "phase_b_current",
+    "phase_c_voltage",
+    "phase_c_current",
+    "power",
+    "temperature",
+    "current_charging_amount",
+    "current_charging_time",
+    "total_charge",
+    "update_time",
+    "error",
+)
+
+# ``error`` only shows up as a key when parsing failed, as it did for dicts
+WallboxNotification = record_type(
+    "WallboxNotification", WALLBOX_FIELDS, optional=("error",)
+)
+
 
 class RenacWallboxBLE(RenacBLE):
     """BLE client for RENAC wallbox chargers."""
 
     def __init__(
-        self, address: str, on_notification: Optional[Callable[[dict], None]] = None
+        self,
+        address: str,
+        on_notification: Optional[Callable[[Record], Any]] = None,
+        adapter: Optional[str] = None,
+        notification_executor: Optional[Executor] = None,
     ) -> None:
         self._parsed_callback = on_notification
-        super().__init__(address, notification_callback=self._handle_raw_notification)
-
-    def _handle_raw_notification(self, data: bytes) -> None:
-        """Parse raw BLE payloads and dispatch structured data."""
+        super().__init__(
+            address,
+            notification_callback=self._handle_raw_notification,
+            adapter=adapter,
+            notification_executor=notification_executor,
+        )
+
+    def _handle_raw_notification(self, data: bytes) -> Any:
+        """Parse raw BLE payloads and dispatch structured data.
+
+        Runs from the notification dispatcher, never on the response path.
+        The callback result is returned so that coroutine callbacks (such as
+        :meth:`TelemetrySink.submit`) are awaited by the dispatcher on the
+        event loop, also when ``notification_executor`` is set.
+        """
 
         if is_wallbox_notification(data):
             parsed = parse_wallbox_notification(data)
             if self._parsed_callback:
-                self._parsed_callback(parsed)
+                return self._parsed_callback(parsed)
+        return None
 
 
 def is_wallbox_notification(data: bytes) -> bool:
@@ -52,13 +96,17 @@ def get_renac_charger_state(code: int) -> str:
     }.get(code, "")
 
 
-def parse_wallbox_notification(data: bytes) -> Optional[dict]:
-    """Parse a wallbox notification payload into a dictionary."""
+def parse_wallbox_notification(data: bytes) -> Optional[Record]:
+    """Parse a wallbox notification payload into a :data:`WallboxNotification`.
+
+    Fields that could not be parsed stay ``None`` and the ``error`` key is
+    only present when parsing failed.
+    """
 
     if not data.startswith(b"#SOCKA#"):
         raise ValueError("Invalid message: missing #SOCKA# header")
     payload = data[7:]  # remove '#SOCKA#'
-    result: dict[str, object] = {}
+    result = WallboxNotification()
     try:
         result["model"] = payload[3:35].decode("ascii", errors="ignore").strip("\x00").strip()
         result["sn"] = payload[35:67].decode("ascii", errors="ignore").strip("\x00").strip()
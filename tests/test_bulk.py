@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from renac_ble.bulk import decode_block_frames  # noqa: E402
+from renac_ble.inverter_registers import (  # noqa: E402
+    INVERTER_BASIC_INFO,
+    PV_INPUT_BLOCK,
+    TOTAL_ENERGY_BLOCK,
+)
+from renac_ble.modbus import (  # noqa: E402
+    READ_REGISTER_CODE,
+    SLAVE_ID,
+    crc16,
+    parse_block_response,
+)
+
+
+def _frame(rng, block):
+    payload = bytes(rng.getrandbits(8) for _ in range(block["count"] * 2))
+    return crc16(bytes([SLAVE_ID, READ_REGISTER_CODE, len(payload)]) + payload)
+
+
+@pytest.mark.parametrize(
+    "block", [TOTAL_ENERGY_BLOCK, PV_INPUT_BLOCK, INVERTER_BASIC_INFO]
+)
+def test_bulk_decoding_matches_parse_block_response(block):
+    rng = random.Random(block["address"])
+    frames = [_frame(rng, block) for _ in range(50)]
+    corrupted = bytearray(frames[7])
+    corrupted[-1] ^= 0xFF
+    frames[7] = bytes(corrupted)
+    frames[11] = frames[11][:-1]
+
+    columns, valid = decode_block_frames(frames, block)
+
+    expected_valid = np.ones(len(frames), dtype=bool)
+    expected_valid[[7, 11]] = False
+    np.testing.assert_array_equal(valid, expected_valid)
+    for row, frame in enumerate(frames):
+        if not valid[row]:
+            continue
+        record = parse_block_response(frame[3:-2], block)
+        for field in block["fields"]:
+            name = field["name"]
+            value = columns[name][row]
+            if field["fmt"] == "custom":
+                value = value.tobytes()
+            assert value == record[name], (row, name)
@@ -0,0 +1,63 @@
+import pytest
+
+from renac_ble.derived import DERIVED_FIELDS, DerivedMetrics, _sort_fields
+
+
+def test_partial_update_only_changes_dependent_fields():
+    metrics = DerivedMetrics(DERIVED_FIELDS)
+    metrics.update(
+        {
+            "eps_r_power": 100,
+            "eps_s_power": 200,
+            "eps_t_power": 300,
+            "consumption_today_energy": 5,
+            "feedin_today_energy": 2,
+            "battery_today_charge_energy": 4,
+            "battery_today_discharge_energy": 1,
+            "pv_today_energy": 10,
+            "load_today_energy": 16,
+        }
+    )
+
+    values = metrics.update({"eps_s_power": 250})
+    assert metrics.changed == {"eps_power"}
+    assert values["eps_power"] == 650
+    assert values["grid_net_today_energy"] == 3
+
+    values = metrics.update({"feedin_today_energy": 4})
+    assert metrics.changed == {
+        "grid_net_today_energy",
+        "self_consumption_today_energy",
+        "self_consumption_today_ratio",
+        "self_sufficiency_today_ratio",
+    }
+    assert values["self_consumption_today_ratio"] == pytest.approx(0.6)
+
+    metrics.update({"feedin_today_energy": 4})
+    assert metrics.changed == set()
+
+
+def test_none_propagates_through_self_consumption_ratio():
+    metrics = DerivedMetrics(DERIVED_FIELDS)
+    values = metrics.update({"pv_today_energy": 10, "feedin_today_energy": None})
+    assert values["self_consumption_today_energy"] is None
+    assert values["self_consumption_today_ratio"] is None
+
+    values = metrics.update({"feedin_today_energy": 5})
+    assert values["self_consumption_today_ratio"] == pytest.approx(0.5)
+
+    values = metrics.update({"pv_today_energy": None})
+    assert values["self_consumption_today_energy"] is None
+    assert values["self_consumption_today_ratio"] is None
+    assert "self_consumption_today_ratio" in metrics.changed
+
+
+def test_cyclic_fields_are_rejected():
+    fields = [
+        {"name": "a", "inputs": ["b"], "func": lambda b: b, "unit": ""},
+        {"name": "b", "inputs": ["a"], "func": lambda a: a, "unit": ""},
+    ]
+    with pytest.raises(ValueError, match="Cyclic dependency"):
+        _sort_fields(fields)
+    with pytest.raises(ValueError, match="Cyclic dependency"):
+        DerivedMetrics(fields)
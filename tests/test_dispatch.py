@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from renac_ble.dispatch import NotificationDispatcher
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_coroutine_callbacks_are_awaited(use_executor):
+    received = []
+
+    async def callback(item):
+        await asyncio.sleep(0)
+        received.append(item)
+
+    async def run():
+        with ThreadPoolExecutor(1) as pool:
+            dispatcher = NotificationDispatcher(
+                callback, executor=pool if use_executor else None
+            )
+            dispatcher.submit(b"\x01")
+            await dispatcher.join()
+            await dispatcher.stop()
+            return dispatcher.stats()
+
+    stats = asyncio.run(run())
+    assert received == [b"\x01"]
+    assert stats["processed"] == 1
+    assert stats["errors"] == 0
+
+
+def test_full_queue_drops_oldest():
+    received = []
+
+    async def run():
+        dispatcher = NotificationDispatcher(received.append, maxsize=2)
+        for i in range(4):
+            dispatcher.submit(i)
+        await dispatcher.join()
+        await dispatcher.stop()
+        return dispatcher.stats()
+
+    stats = asyncio.run(run())
+    assert received == [2, 3]
+    assert stats["dropped"] == 2
+
+
+def test_stop_delivers_pending_notifications():
+    received = []
+
+    async def run():
+        dispatcher = NotificationDispatcher(received.append)
+        for i in range(3):
+            dispatcher.submit(i)
+        await dispatcher.stop()
+        return dispatcher.stats()
+
+    stats = asyncio.run(run())
+    assert received == [0, 1, 2]
+    assert stats["dropped"] == 0
+
+
+def test_stop_counts_undelivered_notifications_as_dropped():
+    async def callback(item):
+        await asyncio.sleep(10)
+
+    async def run():
+        dispatcher = NotificationDispatcher(callback)
+        for i in range(3):
+            dispatcher.submit(i)
+        await dispatcher.stop(timeout=0.01)
+        return dispatcher.stats()
+
+    stats = asyncio.run(run())
+    # the first notification was being delivered when the consumer stopped
+    assert stats["processed"] == 1
+    assert stats["dropped"] == 2
+    assert stats["depth"] == 0
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+import pytest
+
+from renac_ble.fleet import FleetWorker, SampleDecoder, SampleEncoder
+
+
+def test_codec_round_trip_interns_keys():
+    encoder, decoder = SampleEncoder(), SampleDecoder()
+    first = {"pv_power": 1200, "voltage": 230.5, "model": "R3", "fault": None}
+    second = {"pv_power": 1300, "voltage": 231.0, "model": "R3", "fault": None}
+
+    message = encoder.encode(2, 1.5, first)
+    assert decoder.decode(message) == (2, 1.5, first)
+
+    repeated = encoder.encode(2, 2.5, second)
+    assert b"pv_power" not in repeated
+    assert len(repeated) < len(message)
+    assert decoder.decode(repeated) == (2, 2.5, second)
+
+    # a new key is sent once, next to already interned ones
+    third = {"pv_power": 1, "charging": True, "raw": b"\x00\xff"}
+    assert decoder.decode(encoder.encode(0, 3.0, third)) == (0, 3.0, third)
+    _, _, sample = decoder.decode(encoder.encode(0, 4.0, third))
+    assert sample["charging"] is True
+    assert sample["raw"] == b"\x00\xff"
+
+
+def test_unsupported_values_are_rejected_without_registering_keys():
+    encoder, decoder = SampleEncoder(), SampleDecoder()
+    with pytest.raises(TypeError):
+        encoder.encode(0, 0.0, {"pv_power": 1, "bad": object()})
+    # the rejected sample must not leave keys the decoder never saw
+    assert decoder.decode(encoder.encode(0, 1.0, {"pv_power": 2})) == (
+        0,
+        1.0,
+        {"pv_power": 2},
+    )
+
+
+class FakeClient:
+    def __init__(self, device, on_sample):
+        self.device = device
+        self.on_sample = on_sample
+        self.client = None
+        self.polls = 0
+        self.disconnected = False
+
+    def is_connected(self):
+        return self.client is not None
+
+    async def connect(self):
+        self.client = object()
+        if self.device["kind"] == "wallbox":
+            self.on_sample({"status": "charging", "power": 7.4})
+
+    async def disconnect(self):
+        self.disconnected = True
+
+    async def get_power_and_energy_overview(self):
+        self.polls += 1
+        return {"pv_power": self.polls}
+
+
+def test_worker_sends_samples_from_a_thread():
+    devices = [
+        {"address": "AA", "kind": "inverter"},
+        {"address": "BB", "kind": "wallbox"},
+    ]
+    clients = []
+    messages = []
+    threads = set()
+
+    def factory(device, adapter, on_sample):
+        client = FakeClient(device, on_sample)
+        clients.append(client)
+        return client
+
+    def send(message):
+        threads.add(threading.get_ident())
+        messages.append(message)
+
+    async def run():
+        worker = FleetWorker(
+            "hci0", devices, send, poll_interval=0.01, client_factory=factory
+        )
+        task = asyncio.get_running_loop().create_task(worker.run())
+        while len(messages) < 3:
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await task
+        return worker
+
+    worker = asyncio.run(run())
+    decoder = SampleDecoder()
+    samples = [decoder.decode(message) for message in messages]
+    assert threading.get_ident() not in threads
+    assert [sample for index, _, sample in samples if index == 1] == [
+        {"status": "charging", "power": 7.4}
+    ]
+    polled = [sample["pv_power"] for index, _, sample in samples if index == 0]
+    assert polled == list(range(1, len(polled) + 1))
+    assert worker.sent == len(messages)
+    assert worker.dropped == 0
+    assert all(client.disconnected for client in clients)
+
+
+def test_full_queue_drops_oldest_sample():
+    messages = []
+
+    async def run():
+        worker = FleetWorker(None, [], messages.append, queue_size=2)
+        for i in range(4):
+            worker._emit(0, {"i": i})
+        await worker.run()
+        return worker
+
+    worker = asyncio.run(run())
+    decoder = SampleDecoder()
+    assert [decoder.decode(message)[2] for message in messages] == [{"i": 2}, {"i": 3}]
+    assert worker.dropped == 2
+    assert worker.sent == 2
@@ -0,0 +1,55 @@
+import asyncio
+
+from renac_ble.derived import DerivedMetrics
+from renac_ble.inverter import OverviewRecord, RenacInverterBLE
+from renac_ble.modbus import crc16
+
+
+class RegisterClient:
+    """Answer every read with zeroed registers."""
+
+    def __init__(self, device: RenacInverterBLE) -> None:
+        self.device = device
+
+    async def write_gatt_char(self, uuid, payload):
+        count = int.from_bytes(payload[4:6], "big")
+
+        async def answer():
+            await asyncio.sleep(0)
+            frame = crc16(bytes([0x01, 0x03, count * 2]) + bytes(count * 2))
+            await self.device._notify_handler(None, bytearray(frame))
+
+        asyncio.get_running_loop().create_task(answer())
+
+
+def _overview(inverter: RenacInverterBLE):
+    inverter.client = RegisterClient(inverter)
+    return asyncio.run(inverter.get_power_and_energy_overview())
+
+
+PV_SHARE = {
+    "name": "pv_share",
+    "inputs": ["pv_power", "load_power"],
+    "func": lambda pv, load: pv / load if load else None,
+    "unit": "",
+}
+
+
+def test_default_overview_record():
+    overview = _overview(RenacInverterBLE("00:00:00:00:00:00"))
+    assert type(overview) is OverviewRecord
+    assert overview["eps_power"] == 0
+
+
+def test_overview_with_custom_derived_fields():
+    inverter = RenacInverterBLE("00:00:00:00:00:00", derived_fields=[PV_SHARE])
+    overview = _overview(inverter)
+    assert "pv_share" in overview
+    assert "eps_power" not in overview
+
+
+def test_overview_follows_replaced_derived_metrics():
+    inverter = RenacInverterBLE("00:00:00:00:00:00")
+    inverter.derived = DerivedMetrics([PV_SHARE])
+    overview = _overview(inverter)
+    assert overview.keys()[-1] == "pv_share"
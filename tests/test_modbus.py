@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from renac_ble.ble import RenacBLE
+from renac_ble.modbus import crc16, extract_read_response
+
+
+def test_extract_read_response_slices_data():
+    frame = crc16(bytes([0x01, 0x03, 6, 0, 1, 0, 2, 0, 3]))
+    assert extract_read_response(frame, 1, 2) == crc16(bytes([0x01, 0x03, 4, 0, 2, 0, 3]))
+
+
+def test_extract_read_response_rejects_exception_reply():
+    with pytest.raises(ValueError):
+        extract_read_response(crc16(bytes([0x01, 0x83, 0x02])), 0, 1)
+
+
+def test_extract_read_response_rejects_bad_byte_count():
+    frame = crc16(bytes([0x01, 0x03, 4, 0, 1, 0, 2, 0, 3]))
+    with pytest.raises(ValueError):
+        extract_read_response(frame, 0, 1)
+
+
+def test_shared_read_exception_reply_is_not_reframed():
+    exception_reply = crc16(bytes([0x01, 0x83, 0x02]))
+
+    class Client:
+        async def write_gatt_char(self, uuid, payload):
+            async def answer():
+                await asyncio.sleep(0)
+                await device._notify_handler(None, bytearray(exception_reply))
+
+            asyncio.get_running_loop().create_task(answer())
+
+    device = RenacBLE("00:00:00:00:00:00")
+    device.client = Client()
+
+    async def read_both():
+        return await asyncio.gather(
+            device._read_registers(11000, 6), device._read_registers(11000, 1)
+        )
+
+    shared, joined = asyncio.run(read_both())
+    assert shared == exception_reply
+    assert joined is None
@@ -0,0 +1,36 @@
+from renac_ble.inverter_registers import INVERTER_BASIC_INFO, PV_INPUT_BLOCK
+from renac_ble.modbus import parse_block_response
+from renac_ble.records import record_type
+
+
+def test_record_mapping_interface():
+    Sample = record_type("Sample", ["a", "b"])
+    sample = Sample(1, b=2)
+    assert sample["a"] == 1
+    assert dict(sample) == {"a": 1, "b": 2}
+    assert {**sample} == sample.as_dict()
+    assert sample == {"a": 1, "b": 2}
+
+
+def test_optional_fields_hidden_while_none():
+    Sample = record_type("Sample", ["a", "error"], optional=["error"])
+    sample = Sample(1)
+    assert "error" not in sample
+    assert sample.keys() == ("a",)
+    assert len(sample) == 1
+    sample["error"] = "boom"
+    assert "error" in sample
+    assert sample.as_dict() == {"a": 1, "error": "boom"}
+
+
+def test_record_types_are_cached_by_name():
+    assert record_type("Foo", ["a"]) is record_type("Foo", ["a"])
+    assert record_type("Bar", ["a"]).__name__ == "Bar"
+
+
+def test_each_block_has_its_own_record_type():
+    info = parse_block_response(bytes(76), INVERTER_BASIC_INFO)
+    pv = parse_block_response(bytes(12), PV_INPUT_BLOCK)
+    assert type(info).__name__ == "InverterBasicInfo"
+    assert type(pv).__name__ == "PvInput"
+    assert repr(pv).startswith("PvInput(")
@@ -0,0 +1,79 @@
+import asyncio
+
+from renac_ble.modbus import crc16
+from renac_ble.scanner import RegisterMap, RegisterScanner, firmware_key, read_firmware_key
+
+
+def _basic_info_frame(hmi_version: int) -> bytes:
+    data = bytearray(76)
+    data[0:6] = b"R3-10K"
+    data[70:72] = hmi_version.to_bytes(2, "big")
+    return crc16(bytes([0x01, 0x03, len(data)]) + bytes(data))
+
+
+def test_firmware_key_uses_raw_versions():
+    keys = {firmware_key(_basic_info_frame(v)) for v in (123, 145, 199)}
+    assert keys == {"R3-10K-123", "R3-10K-145", "R3-10K-199"}
+
+
+def test_firmware_key_without_response():
+    assert firmware_key(None) == "unknown"
+    assert firmware_key(crc16(bytes([0x01, 0x83, 0x02]))) == "unknown"
+
+
+def test_plan_reads_stays_in_readable_ranges():
+    register_map = RegisterMap()
+    register_map.mark(1000, 50, "readable")
+    register_map.mark(1050, 3, "unreadable")
+    register_map.mark(1053, 47, "readable")
+    assert register_map.plan_reads([(1000, 1), (1040, 3), (1060, 2)]) == [
+        (1000, 43),
+        (1060, 2),
+    ]
+
+
+class FakeDevice:
+    """Answer reads that lie fully inside ``readable`` ranges."""
+
+    def __init__(self, readable):
+        self.readable = readable
+        self.requests = 0
+
+    async def read_raw_registers(self, address, count, timeout=15.0):
+        self.requests += 1
+        if any(start <= address and address + count <= stop for start, stop in self.readable):
+            return crc16(bytes([0x01, 0x03, count * 2]) + bytes(count * 2))
+        return crc16(bytes([0x01, 0x83, 0x02]))
+
+
+def _scan(device, register_map=None, start=10000, end=12000):
+    scanner = RegisterScanner(device, register_map)
+    return asyncio.run(scanner.scan(start, end)), scanner
+
+
+def test_scanner_maps_holes_within_request_budget():
+    device = FakeDevice([(10000, 10100), (11000, 11050)])
+    register_map, scanner = _scan(device)
+    assert register_map.ranges == [
+        (10000, 10100, "readable"),
+        (10100, 11000, "unreadable"),
+        (11000, 11050, "readable"),
+        (11050, 12000, "unreadable"),
+    ]
+    assert scanner.requests == device.requests
+    assert device.requests <= 100
+
+
+def test_scanner_resume_skips_known_ranges():
+    register_map, _ = _scan(FakeDevice([(10000, 10100)]), end=11000)
+    device = FakeDevice([(10000, 10100)])
+    _scan(device, register_map, end=11000)
+    assert device.requests == 0
+
+
+def test_read_firmware_key_uses_public_raw_read():
+    class Device:
+        async def read_raw_registers(self, address, count, timeout=15.0):
+            return _basic_info_frame(145)
+
+    assert asyncio.run(read_firmware_key(Device())) == "R3-10K-145"
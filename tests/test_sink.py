@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from renac_ble.sink import FileWriter, TelemetrySink, encode_line_protocol
+
+
+class SlowWriter:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.data = b""
+        self.closed = False
+
+    async def write(self, data: bytes) -> None:
+        await asyncio.sleep(self.delay)
+        self.data += data
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_encode_line_protocol():
+    line = encode_line_protocol(
+        "renac", {"address": "AA:BB"}, {"power": 5, "soc": 51.5, "state": "idle", "x": None}, 7
+    )
+    assert line == 'renac,address=AA:BB power=5i,soc=51.5,state="idle" 7\n'
+
+
+def test_close_waits_for_in_flight_periodic_flush():
+    writer = SlowWriter()
+
+    async def run():
+        sink = TelemetrySink(writer, max_batch=100, flush_interval=0.01)
+        await sink.start()
+        await sink.submit({"value": 1}, timestamp=1)
+        # let the periodic flush start writing, then close mid-write
+        await asyncio.sleep(0.03)
+        await sink.close()
+        return sink
+
+    sink = asyncio.run(run())
+    assert writer.data == b"renac value=1i 1\n"
+    assert writer.closed
+    assert sink.written == 1
+    assert sink.dropped == 0
+
+
+def test_cancelled_flush_writes_batch_once(tmp_path, monkeypatch):
+    path = tmp_path / "samples.lp"
+    writer = FileWriter(str(path))
+    write = writer._write
+
+    def slow_write(data: bytes) -> None:
+        # blocks a worker thread, which cancelling the task cannot stop
+        time.sleep(0.05)
+        write(data)
+
+    monkeypatch.setattr(writer, "_write", slow_write)
+
+    async def run():
+        sink = TelemetrySink(writer, max_batch=100)
+        await sink.submit({"value": 1}, timestamp=1)
+        task = asyncio.create_task(sink.flush())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await sink.close()
+        return sink
+
+    sink = asyncio.run(run())
+    assert path.read_bytes() == b"renac value=1i 1\n"
+    assert sink.written == 1
+    assert sink.dropped == 0
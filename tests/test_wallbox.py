@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from renac_ble.sink import TelemetrySink
+from renac_ble.wallbox import RenacWallboxBLE, parse_wallbox_notification
+
+NOTIFICATION = b"#SOCKA#\x01\x03\x8e" + bytes(140)
+
+
+class MemoryWriter:
+    def __init__(self) -> None:
+        self.data = b""
+
+    async def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def close(self) -> None:
+        pass
+
+
+def test_sink_submit_with_notification_executor():
+    writer = MemoryWriter()
+
+    async def run():
+        sink = TelemetrySink(writer, encoder="ndjson")
+        with ThreadPoolExecutor(1) as pool:
+            wallbox = RenacWallboxBLE(
+                "00:00:00:00:00:00",
+                on_notification=sink.submit,
+                notification_executor=pool,
+            )
+            # no request pending, so the frame is unsolicited
+            wallbox._response_event.set()
+            await wallbox._notify_handler(None, bytearray(NOTIFICATION))
+            await wallbox.dispatcher.join()
+            await wallbox.disconnect()
+        await sink.close()
+
+    asyncio.run(run())
+    assert b'"state":"idle"' in writer.data
+
+
+def test_parse_good_notification_has_no_error_key():
+    parsed = parse_wallbox_notification(NOTIFICATION)
+    assert "error" not in parsed
+    assert "error" not in parsed.as_dict()
+    assert parsed.get("error") is None
+    assert parsed.error is None
+    assert parsed["state"] == "idle"
+
+
+def test_parse_truncated_notification_reports_error():
+    parsed = parse_wallbox_notification(b"#SOCKA#" + bytes(100))
+    assert "error" in parsed
+    assert parsed["error"].startswith("Error parsing")
+    assert parsed.as_dict()["error"] == parsed.error